@@ -1,5 +1,5 @@
-import ast
 import os
+import re
 from setuptools import setup, find_packages
 
 META_PATH = os.path.join(
@@ -7,8 +7,14 @@ META_PATH = os.path.join(
     "src", "bfa", "__init__.py",
 )
 
+ASSIGNMENT = re.compile(
+    r'^(?P<name>__\w+__)\s*=\s*'
+    r'(?:"""(?P<triple>.*?)"""|"(?P<single>[^"]*)")',
+    re.MULTILINE | re.DOTALL,
+)
+
 
-class CollectMetadata(ast.NodeVisitor):
+class CollectMetadata(object):
     """
     Collect metadata from a Python module.
     """
@@ -23,25 +29,17 @@ class CollectMetadata(ast.NodeVisitor):
 
         :return: :py:class:`CollectMetadata`
         """
-        metadata = cls(path)
         with open(path) as f:
-            metadata.visit(ast.parse(f.read(), META_PATH))
-        return metadata
+            source = f.read()
+        return cls(path, {
+            match.group("name"):
+                match.group("triple") or match.group("single")
+            for match in ASSIGNMENT.finditer(source)
+        })
 
-    def __init__(self, path):
+    def __init__(self, path, assignments):
         self._path = path
-        self._assignments = {}
-
-    def visit_Assign(self, assign):
-        """
-        Record assignments of strings to names.
-
-        :param assign: An ``Assign`` node.
-        """
-        for target in assign.targets:
-            if (isinstance(target, ast.Name) and
-                isinstance(assign.value, ast.Str)):
-                self._assignments[target.id] = assign.value.s
+        self._assignments = assignments
 
     def get(self, name):
         """
@@ -71,6 +69,7 @@ setup(
     license=metadata.get("__license__"),
     packages=find_packages("src"),
     package_dir={"": "src"},
+    python_requires=">=3.6",
     install_requires=[
         "attrs",
         "incremental",
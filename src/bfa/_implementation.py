@@ -1,52 +1,28 @@
-import sys
+import functools
+import weakref
 
 import attr
 
 
-if sys.version_info.major == 2:
-    from collections import Mapping
-
-    class MappingProxyType(Mapping):
-        """
-        Read-only proxy of a mapping.  It provides a dynamic view on
-        the mapping’s entries, which means that when the mapping
-        changes, the view reflects these changes.
-        """
-        __slots__ = ("_mapping",)
-
-        def __init__(self, mapping):
-            self._mapping = mapping
-
-        def __getitem__(self, item):
-            """
-            Return the item of the underlying mapping with key key.
-            Raises a KeyError if key is not in the underlying mapping.
-            """
-            return self._mapping[item]
-
-        def __iter__(self):
-            """
-            Return an iterator over the keys of the underlying
-            mapping.  This is a shortcut for iter(proxy.keys()).
-            """
-            return iter(self._mapping)
-
-        def __len__(self):
-            """
-            Return the number of items in the underlying mapping.
-            """
-            return len(self._mapping)
+@functools.lru_cache(maxsize=None)
+def _class_info(cls):
+    """
+    Determine all argument names and all required argument names for
+    an :py:mod:`attr` decorated class.
 
-        def copy(self):
-            """
-            """
-            return self._mapping.copy()
+    The walk over the class' attribute descriptors happens only once
+    per class; subsequent calls return the cached result.
 
-        def __repr__(self):
-            return "mappingproxy({!r})".format(self._mapping)
+    :param cls: The :py:mod:`attr` decorated class.
 
-else:
-    from types import MappingProxyType
+    :return: A pair of (all names, required names).
+    :rtype: :py:class:`tuple` of two :py:class:`frozenset`\\ s
+    """
+    fields = attr.fields(cls)
+    return (
+        frozenset(a.name for a in fields),
+        frozenset(a.name for a in fields if a.default is attr.NOTHING),
+    )
 
 
 class ConsumedArgument(Exception):
@@ -94,7 +70,61 @@ class IncompleteArguments(Exception):
         )
 
 
-@attr.s(frozen=True)
+class _Setter(object):
+    """
+    A callable that supplies the value for a single argument of an
+    in-progress builder.
+
+    Don't use this directly!  Instead, access an attribute on a
+    builder returned by :py:func:`builder`.
+    """
+
+    __slots__ = ("_building", "_name")
+
+    def __init__(self, building, name):
+        self._building = building
+        self._name = name
+
+    def __call__(self, value):
+        building = self._building
+        name = self._name
+        remaining = building._remaining_required
+        if name in building._required_arguments:
+            remaining -= 1
+        return type(building)(
+            cls=building._cls,
+            all_arguments=building._all_arguments,
+            required_arguments=building._required_arguments,
+            remaining_required=remaining,
+            arguments=building._arguments + ((name, value),),
+            consumed_arguments=building._consumed_arguments | {name},
+        )
+
+
+class _SetterDescriptor(object):
+    """
+    A descriptor that makes one argument of the wrapped class settable
+    on a builder as a real attribute, avoiding the
+    :py:meth:`~object.__getattr__` fallback protocol entirely.
+
+    Don't use this directly!  Instead, call :py:func:`builder`.
+    """
+
+    __slots__ = ("_name",)
+
+    def __init__(self, name):
+        self._name = name
+
+    def __get__(self, building, owner):
+        if building is None:
+            return self
+        name = self._name
+        if name in building._consumed_arguments:
+            raise ConsumedArgument(building._cls, name)
+        return _Setter(building, name)
+
+
+@attr.s(frozen=True, slots=True, eq=False, repr=False)
 class _Building(object):
     """
     An in-progress builder.  This is an intermediary that collects
@@ -103,56 +133,12 @@ class _Building(object):
     Don't use this directly!  Instead, call :py:func:`build`.
     """
     _cls = attr.ib()
-    _arguments = attr.ib(MappingProxyType({}))
-
     _all_arguments = attr.ib()
     _required_arguments = attr.ib()
-    _consumed_arguments = attr.ib(frozenset())
-
-    @_all_arguments.default
-    def determine_names(self):
-        """
-        Determine all argument names for the wrapped class.
-        """
-        return frozenset(a.name for a in attr.fields(self._cls))
-
-    @_required_arguments.default
-    def create_required(self):
-        """
-        Determine all required names for the wrapped class.
-        """
-        return frozenset(
-            a.name
-            for a in attr.fields(self._cls)
-            if a.default is attr.NOTHING
-        )
-
-    def __getattr__(self, name):
-        if name in self._all_arguments:
-            new_arguments = dict(self._arguments)
-
-            def set_value(value):
-                new_arguments[name] = value
-                return attr.evolve(
-                    self,
-                    arguments=MappingProxyType(new_arguments),
-                    all_arguments=self._all_arguments - {name},
-                    required_arguments=self._required_arguments - {name},
-                    consumed_arguments=self._consumed_arguments | {name},
-                )
-
-            set_value.__name__ = name
-            set_value.__doc__ = (
-                "Set the argument {!r} for a new instance of {!r}".format(
-                    name, self._cls,
-                )
-            )
+    _remaining_required = attr.ib()
 
-            return set_value
-        elif name in self._consumed_arguments:
-            raise ConsumedArgument(self._cls, name)
-        else:
-            raise AttributeError(name)
+    _arguments = attr.ib(())
+    _consumed_arguments = attr.ib(frozenset())
 
     def build(self):
         """
@@ -163,15 +149,48 @@ class _Building(object):
                  remain unspecified.
         """
 
-        if self._required_arguments:
+        if self._remaining_required:
             raise IncompleteArguments(
                 self._cls,
-                present=frozenset(self._arguments),
-                missing=frozenset(self._required_arguments),
+                present=frozenset(name for name, _ in self._arguments),
+                missing=self._required_arguments - self._consumed_arguments,
             )
-        return self._cls(**self._arguments)
+        return self._cls(**dict(self._arguments))
+
+
+_builder_types = weakref.WeakKeyDictionary()
+
+
+def _builder_type(for_class):
+    """
+    Synthesize (or fetch the cached) builder type specialized for an
+    :py:mod:`attr` decorated class.
+
+    The generated type subclasses :py:class:`_Building` and carries a
+    :py:class:`_SetterDescriptor` for each argument name, so setting
+    an argument is a plain attribute lookup rather than a
+    :py:meth:`~object.__getattr__` miss plus membership tests.
+
+    :param for_class: The :py:mod:`attr` decorated class.
+
+    :return: A :py:class:`_Building` subclass.
+    """
+    try:
+        return _builder_types[for_class]
+    except KeyError:
+        all_arguments, _ = _class_info(for_class)
+        namespace = {"__slots__": ()}
+        for name in all_arguments:
+            if not hasattr(_Building, name):
+                namespace[name] = _SetterDescriptor(name)
+        builder_type = type(
+            "Builder_" + for_class.__name__, (_Building,), namespace,
+        )
+        _builder_types[for_class] = builder_type
+        return builder_type
 
 
+@functools.lru_cache(maxsize=None)
 def builder(for_class):
     """
     Construct a builder for an :py:mod:`attr` decorated class.
@@ -192,17 +211,17 @@ def builder(for_class):
 
     Arguments can't be added twice:
 
-    >>> with_a.a(1)  # doctest: +NORMALIZE_WHITESPACE
+    >>> with_a.a(1)  # doctest: +NORMALIZE_WHITESPACE +ELLIPSIS
     Traceback (most recent call last):
-    ConsumedArgument: Attempted to set value for
-                      consumed attribute 'a' of
-                      class <class '_implementation.Class'>
+    bfa._implementation.ConsumedArgument: Attempted to set value for
+                                          consumed attribute 'a' of
+                                          class <class '...Class'>
 
     Unknown arguments aren't allowed:
 
-    >>> with_a.unknown("value")
+    >>> with_a.unknown("value")  # doctest: +ELLIPSIS
     Traceback (most recent call last):
-    AttributeError: unknown
+    AttributeError: 'Builder_Class' object has no attribute 'unknown'...
 
     Create an instance by calling :py:meth:`build`:
 
@@ -212,10 +231,18 @@ def builder(for_class):
     But instances can't be created without all their required
     arguments:
 
-    >>> with_a.build()  # doctest: +NORMALIZE_WHITESPACE
+    >>> with_a.build()  # doctest: +NORMALIZE_WHITESPACE +ELLIPSIS
     Traceback (most recent call last):
-    IncompleteArguments: Attempted construction of incomplete class
-                         <class '_implementation.Class'>:
-                         have frozenset(['a']), need frozenset(['b'])
+    bfa._implementation.IncompleteArguments: Attempted construction of
+                                             incomplete class
+                                             <class '...Class'>:
+                                             have frozenset({'a'}),
+                                             need frozenset({'b'})
     """
-    return _Building(for_class)
+    all_arguments, required_arguments = _class_info(for_class)
+    return _builder_type(for_class)(
+        for_class,
+        all_arguments=all_arguments,
+        required_arguments=required_arguments,
+        remaining_required=len(required_arguments),
+    )
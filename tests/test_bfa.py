@@ -1,71 +1,20 @@
 import keyword
 import string
-import sys
 
 import attr
-import operator
 import pytest
-from hypothesis import assume, given
+from hypothesis import assume
 from hypothesis import strategies as st
 from hypothesis.stateful import Bundle, RuleBasedStateMachine, rule
 
 from bfa import ConsumedArgument, IncompleteArguments, builder
 
 
-@pytest.mark.skipif(sys.version_info.major > 2,
-                    reason="MappingProxyType comes with >= Python 3.3")
-class TestMappingProxyType(object):
-    """
-    Tests for :py:class:`MappingProxyType`.
-    """
-
-    @given(dictionary=st.dictionaries(st.text(), st.text()))
-    def test_dict_equivalency(self, dictionary):
-        """
-        :py:class:`MappingProxyType`s match the read interface of
-        :py:class:`dict`s.
-        """
-        from bfa._implementation import MappingProxyType
-
-        mappingproxy = MappingProxyType(dictionary)
-
-        # iter
-        assert list(mappingproxy) == list(dictionary)
-
-        assert mappingproxy.keys() == dictionary.keys()
-        assert mappingproxy.values() == dictionary.values()
-        assert mappingproxy.items() == dictionary.items()
-
-        for k in dictionary:
-            # getitem
-            assert mappingproxy[k] == dictionary[k]
-            assert mappingproxy.get(k) == dictionary.get(k)
-            # contains
-            assert k in mappingproxy
-
-        assert len(mappingproxy) == len(dictionary)
-
-        # negative test cases
-        assert 0 not in dictionary and 0 not in mappingproxy
-
-        default = 'value'
-        assert dictionary.get(0) is mappingproxy.get(0)
-        assert dictionary.get(0, default) == mappingproxy.get(0, default)
-
-        assert mappingproxy.copy() == dictionary
-
-        assert repr(mappingproxy).startswith("mappingproxy")
-
-
 attributes = st.builds(attr.ib, default=st.just(attr.NOTHING) | st.integers())
 
 
 alphabet = string.ascii_uppercase + string.ascii_lowercase
-if sys.version_info.major == 2:
-    alphabet = alphabet.decode('ascii')
 identifiers = st.text(alphabet=alphabet, min_size=1, )
-if sys.version_info.major == 2:
-    identifiers = identifiers.map(operator.methodcaller("encode"))
 
 identifiers = identifiers.filter(lambda i: not keyword.iskeyword(i))
 
@@ -77,13 +26,11 @@ def classes(attributes):
     """
     Generate ``attrs`` classes with the given attributes.
     """
-    defaults_last = sorted(
-        attributes.values(),
-        key=lambda a: 0 if a._default == attr.NOTHING else 1,
-    )
-    for i, attribute in enumerate(defaults_last):
-        attribute.counter = i
-    return st.builds(attr.make_class, identifiers, st.just(attributes))
+    defaults_last = dict(sorted(
+        attributes.items(),
+        key=lambda item: 0 if item[1]._default == attr.NOTHING else 1,
+    ))
+    return st.builds(attr.make_class, identifiers, st.just(defaults_last))
 
 
 @attr.s(frozen=True)